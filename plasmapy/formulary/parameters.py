@@ -5,35 +5,200 @@ plasma frequency or Debye length.
 __all__ = [
     "mass_density",
     "Alfven_speed",
+    "Alfven_speed_lite",
     "ion_sound_speed",
+    "ion_sound_speed_lite",
     "thermal_speed",
+    "thermal_speed_cached",
+    "thermal_speed_lite",
     "thermal_pressure",
+    "thermal_pressure_lite",
     "kappa_thermal_speed",
     "Hall_parameter",
     "gyrofrequency",
+    "gyrofrequency_batch",
+    "gyrofrequency_cached",
+    "gyrofrequency_lite",
     "gyroradius",
+    "gyroradius_batch",
+    "gyroradius_lite",
     "plasma_frequency",
+    "plasma_frequency_lite",
     "Debye_length",
+    "Debye_length_lite",
     "Debye_number",
     "inertial_length",
+    "inertial_length_lite",
     "magnetic_pressure",
+    "magnetic_pressure_lite",
     "magnetic_energy_density",
     "upper_hybrid_frequency",
     "lower_hybrid_frequency",
 ]
 
+import math
 import numbers
 import numpy as np
 import warnings
 
 from astropy import units as u
 from astropy.constants.si import (m_p, m_e, c, mu0, k_B, e, eps0)
+from functools import lru_cache
 from plasmapy import atomic
 from plasmapy.utils import PhysicsError
 from plasmapy.utils.decorators import (angular_freq_to_hz, check_relativistic, validate_quantities)
-from plasmapy.utils.exceptions import PhysicsWarning
+from plasmapy.utils.exceptions import (ImplicitUnitConversionWarning, PhysicsWarning)
 from typing import Optional
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _jit(func):
+    """
+    Compile a lite function with `numba.njit` when numba is installed,
+    and return the function unchanged otherwise.
+    """
+    if njit is None:
+        return func
+    # fastmath is deliberately left off: it would break the propagation
+    # of nan values that callers (and our tests) rely upon.  The numpy
+    # error model keeps division by zero returning inf/nan, as the
+    # uncompiled functions do, instead of raising ZeroDivisionError.
+    return njit(cache=True, error_model='numpy')(func)
+
+
+# The "lite" functions below do their arithmetic on plain `float` and
+# `~numpy.ndarray` objects in SI units, so the SI values of the physical
+# constants they need are extracted once at import time.  This avoids
+# paying for `~astropy.units.Quantity` unit composition on every call.
+_K_B = float(k_B.value)
+_MU0 = float(mu0.value)
+_E = float(e.value)
+_EPS0 = float(eps0.value)
+_M_P = float(m_p.value)
+_M_E = float(m_e.value)
+_C = float(c.value)
+
+# Derived scalars that would otherwise be recomputed on every call.
+_SQRT2 = math.sqrt(2.0)
+_SQRT3 = math.sqrt(3.0)
+_SQRT_8_OVER_PI = math.sqrt(8.0 / math.pi)
+_E_OVER_SQRT_EPS0 = _E / math.sqrt(_EPS0)
+_FOUR_THIRDS_PI = 4 / 3 * math.pi
+
+# Maps thermal_speed's method name to the coefficient of sqrt(k_B T / m),
+# as per https://en.wikipedia.org/wiki/Thermal_velocity
+_THERMAL_SPEED_COEFFICIENTS = {
+    "most_probable": _SQRT2,
+    "rms": _SQRT3,
+    "mean_magnitude": _SQRT_8_OVER_PI,
+}
+
+# `plasmapy.formulary.collisions` imports this module, so it cannot be
+# imported at module level here; Hall_parameter resolves the collision
+# frequency functions once on first use and caches them in this tuple.
+_collision_freqs = None
+
+
+@lru_cache(maxsize=256)
+def _cached_particle_mass(particle):
+    """
+    The SI value of `~plasmapy.atomic.particle_mass`, cached per
+    particle, so that repeated calls with a fixed species (e.g. in a
+    parameter sweep) skip re-parsing the particle string.
+    """
+    return float(atomic.particle_mass(particle).value)
+
+
+@lru_cache(maxsize=256)
+def _cached_integer_charge(particle):
+    """`~plasmapy.atomic.integer_charge`, cached per particle."""
+    return atomic.integer_charge(particle)
+
+
+@lru_cache(maxsize=256)
+def _cached_particle_symbol(particle):
+    """The canonical particle symbol, cached per particle."""
+    return atomic.Particle(particle).particle
+
+
+@lru_cache(maxsize=256)
+def _cached_mass_and_default_charge(particle):
+    """
+    Like `_cached_mass_and_charge`, but falls back to a charge state of
+    1 when the particle carries no charge information, matching the
+    historical behavior of `plasma_frequency`.
+    """
+    parsed = atomic.Particle(particle)
+    try:
+        Z = parsed.integer_charge
+    except Exception:
+        Z = 1
+    return float(parsed.mass.value), Z
+
+
+@lru_cache(maxsize=256)
+def _cached_mass_and_charge(particle):
+    """
+    Parse `particle` a single time, returning its SI mass value and its
+    integer charge.  Used where both are needed, to avoid constructing
+    the `~plasmapy.atomic.Particle` twice.
+    """
+    parsed = atomic.Particle(particle)
+    return float(parsed.mass.value), parsed.integer_charge
+
+
+def _validate_si_value(value, name, func_name, unit, equivalencies=None,
+                       can_be_negative=True):
+    """
+    A minimal hand-rolled stand-in for
+    `~plasmapy.utils.decorators.validate_quantities` used on hot paths.
+
+    Converts `value` to `unit` and returns its raw SI value, reproducing
+    the decorator's warnings and error types without its per-call
+    signature binding and validation-dictionary construction.
+    """
+    if value is None:
+        raise ValueError(f"The argument '{name}' to function {func_name}() "
+                         f"can not contain Nones")
+    if not isinstance(value, u.Quantity):
+        try:
+            value = value * unit
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"The argument '{name}' to function {func_name}() should be "
+                f"an astropy Quantity with units equivalent to one of "
+                f"[{unit}]")
+        warnings.warn(u.UnitsWarning(
+            f"The argument '{name}' to function {func_name}() has no "
+            f"specified units. Assuming units of {unit}. To silence this "
+            f"warning, explicitly pass in an astropy Quantity "
+            f"(e.g. 5. * astropy.units.cm) "
+            f"(see http://docs.astropy.org/en/stable/units/)"))
+    if value.unit is not unit:
+        if not value.unit.is_equivalent(unit, equivalencies=equivalencies):
+            raise u.UnitTypeError(
+                f"The argument '{name}' to function {func_name}() should be "
+                f"an astropy Quantity with the following unit: {unit}")
+        if not value.unit.is_equivalent(unit, equivalencies=None):
+            # non-standard conversion
+            warnings.warn(ImplicitUnitConversionWarning(
+                f"The argument '{name}' to function {func_name}() has a "
+                f"non-standard unit conversion..."
+                f"converting {value.unit} to {unit}"))
+        value = value.to(unit, equivalencies=equivalencies)
+    value_si = value.value
+    if np.iscomplexobj(value_si):
+        raise ValueError(f"The argument '{name}' to function {func_name}() "
+                         f"can not contain complex numbers")
+    if not can_be_negative and np.any(value_si < 0):
+        raise ValueError(f"The argument '{name}' to function {func_name}() "
+                         f"can not contain negative numbers")
+    return value_si
+
 
 def _grab_charge(ion, z_mean=None):
     """Utility function to merge two possible inputs for particle charge.
@@ -57,11 +222,20 @@ def _grab_charge(ion, z_mean=None):
     if z_mean is None:
         # warnings.warn("No z_mean given, defaulting to atomic charge",
         #               PhysicsWarning)
-        Z = atomic.integer_charge(ion)
-    else:
-        # using average ionization provided by user
-        Z = z_mean
-    return Z
+        return _cached_integer_charge(ion)
+    # using average ionization provided by user
+    return _charge_from_zmean(z_mean)
+
+
+def _charge_from_zmean(z_mean):
+    """
+    The average ionization provided by the user, as a plain number.
+
+    Hot functions whose caller has already established that ``z_mean``
+    is not `None` call this directly instead of rechecking inside
+    `_grab_charge`.
+    """
+    return z_mean.value if isinstance(z_mean, u.Quantity) else z_mean
 
 
 @validate_quantities(density={'can_be_negative': False},
@@ -111,9 +285,14 @@ def mass_density(density: [u.m ** -3, u.kg / (u.m ** 3)],
     rho = density
     if not rho.unit.is_equivalent(u.kg / u.m ** 3):
         if particle:
-            m_i = atomic.particle_mass(particle)
-            Z = _grab_charge(particle, z_mean)
-            rho = density * m_i + Z * density * m_e
+            if z_mean is None:
+                m_i, Z = _cached_mass_and_charge(particle)
+            else:
+                m_i = _cached_particle_mass(particle)
+                Z = _charge_from_zmean(z_mean)
+            # one fused multiply over the (possibly array-valued) number
+            # density; the species mass term broadcasts as a scalar
+            rho = (density.value * (m_i + Z * _M_E)) << u.kg / u.m ** 3
         else:
             raise ValueError(f"If passing a number density, you must pass a "
                              f"particle (not {particle}) to calculate the mass density!")
@@ -121,6 +300,43 @@ def mass_density(density: [u.m ** -3, u.kg / (u.m ** 3)],
     return rho
 
 
+@_jit
+def Alfven_speed_lite(B, rho):
+    r"""
+    The ``lite`` version of `Alfven_speed`: calculate the Alfvén speed
+    from plain numbers instead of `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    B : float or ~numpy.ndarray
+        The magnetic field magnitude in units of tesla.
+
+    rho : float or ~numpy.ndarray
+        The total mass density in units of kg / m**3.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The Alfvén speed in units of m / s.
+
+    Notes
+    -----
+    Unlike `Alfven_speed`, this function performs no unit conversion or
+    argument validation, so all inputs must already be expressed in SI
+    units.  It is intended for performance-sensitive code (e.g. tight
+    simulation loops or parameter sweeps) where the overhead of
+    `~astropy.units.Quantity` arithmetic would dominate this otherwise
+    simple formula.
+
+    Examples
+    --------
+    >>> Alfven_speed_lite(0.014, 8.4e-8)
+    43090.691218...
+
+    """
+    return np.abs(B) / np.sqrt(_MU0 * rho)
+
+
 @check_relativistic
 @validate_quantities(density={'can_be_negative': False})
 def Alfven_speed(B: u.T,
@@ -215,8 +431,74 @@ def Alfven_speed(B: u.T,
     """
     rho = mass_density(density, ion, z_mean)
 
-    V_A = (np.abs(B) / np.sqrt(mu0 * rho))
-    return V_A
+    B_si = B.value
+    rho_si = rho.value
+    if isinstance(B_si, float) and isinstance(rho_si, float):
+        # scalar fast path: plain float arithmetic beats both a ufunc
+        # call and the numba dispatch overhead
+        V_A = abs(B_si) / math.sqrt(_MU0 * rho_si)
+    else:
+        V_A = Alfven_speed_lite(B_si, rho_si)
+    return V_A << u.m / u.s
+
+
+@_jit
+def ion_sound_speed_lite(T_e, T_i, m_i, Z, gamma_e=1, gamma_i=3, klD2=0.0):
+    r"""
+    The ``lite`` version of `ion_sound_speed`: calculate the ion sound
+    speed from plain numbers instead of `~astropy.units.Quantity`
+    objects.
+
+    Parameters
+    ----------
+    T_e : float or ~numpy.ndarray
+        Electron temperature in units of kelvin.
+
+    T_i : float or ~numpy.ndarray
+        Ion temperature in units of kelvin.
+
+    m_i : float
+        Ion mass in units of kg.
+
+    Z : float
+        Ion charge state.
+
+    gamma_e : float or int
+        The adiabatic index for electrons, which defaults to 1.
+
+    gamma_i : float or int
+        The adiabatic index for ions, which defaults to 3.
+
+    klD2 : float or ~numpy.ndarray
+        The squared product of wavenumber and Debye length,
+        :math:`k^2 \lambda_{D}^2`, which defaults to 0 (the
+        non-dispersive limit).
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The ion sound speed in units of m / s.
+
+    Notes
+    -----
+    Unlike `ion_sound_speed`, this function performs no unit conversion
+    or argument validation, so all inputs must already be expressed in
+    SI units.  It is intended for performance-sensitive code where the
+    overhead of `~astropy.units.Quantity` arithmetic would dominate this
+    otherwise simple formula.
+
+    Examples
+    --------
+    >>> ion_sound_speed_lite(5e6, 0.0, 1.67e-27, 1)
+    203314.525814...
+
+    """
+    # scalar factors are bound once so that array-valued temperatures
+    # see a single broadcasting multiply each
+    electron_term = gamma_e * Z * _K_B
+    ion_term = gamma_i * _K_B
+    return np.sqrt((electron_term * T_e + ion_term * T_i)
+                   / (m_i * (1 + klD2)))
 
 
 @check_relativistic
@@ -364,8 +646,11 @@ def ion_sound_speed(T_e: u.K,
 
     """
     
-    m_i = atomic.particle_mass(ion)
-    Z = _grab_charge(ion, z_mean)
+    if z_mean is None:
+        m_i, Z = _cached_mass_and_charge(ion)
+    else:
+        m_i = _cached_particle_mass(ion)
+        Z = _charge_from_zmean(z_mean)
 
     for gamma, particles in zip([gamma_e, gamma_i], ["electrons", "ions"]):
         if not isinstance(gamma, (numbers.Real, numbers.Integral)):
@@ -382,16 +667,118 @@ def ion_sound_speed(T_e: u.K,
                       "this calculation. To prevent this, values must "
                       "be specified for both n_e and k.", PhysicsWarning)
     elif n_e is not None and k is not None:
-        lambda_D = Debye_length(T_e, n_e)
-        klD2 = (k * lambda_D) ** 2
+        # inline the Debye length on the already-validated SI values:
+        # k^2 lambda_D^2 with no nested decorated call
+        k_si = k.value
+        if isinstance(k_si, float):
+            klD2 = k_si ** 2 * (_EPS0 * _K_B / _E ** 2) * T_e.value / n_e.value
+        else:
+            T_e_v = T_e.value
+            n_e_v = n_e.value
+            klD2 = np.multiply(k_si, k_si)
+            if klD2.shape == np.broadcast(klD2, T_e_v, n_e_v).shape:
+                # chain the ufuncs through one buffer instead of
+                # allocating a temporary per operation
+                klD2 *= _EPS0 * _K_B / _E ** 2
+                klD2 *= T_e_v
+                klD2 /= n_e_v
+            else:
+                # k broadcasts up against T_e / n_e, so the k**2 buffer
+                # cannot hold the result
+                klD2 = klD2 * (_EPS0 * _K_B / _E ** 2) * T_e_v / n_e_v
+
+    V_S = ion_sound_speed_lite(T_e.value, T_i.value, m_i, Z,
+                               gamma_e=gamma_e, gamma_i=gamma_i, klD2=klD2)
+
+    return V_S << u.m / u.s
+
+
+@_jit
+def thermal_speed_lite(T, mass, coef=_SQRT2):
+    r"""
+    The ``lite`` version of `thermal_speed`: calculate the thermal speed
+    from plain numbers instead of `~astropy.units.Quantity` objects.
 
-    try:
-        V_S_squared = (gamma_e * Z * k_B * T_e + gamma_i * k_B * T_i) / (m_i * (1 + klD2))
-        V_S = np.sqrt(V_S_squared).to(u.m / u.s)
-    except Exception:
-        raise ValueError("Unable to find ion sound speed.")
+    Parameters
+    ----------
+    T : float or ~numpy.ndarray
+        The particle temperature in units of kelvin.
+
+    mass : float
+        The particle mass in units of kg.
 
-    return V_S
+    coef : float, optional
+        The numerical coefficient of :math:`\sqrt{k_B T / m}` for the
+        method used to calculate the thermal speed: :math:`\sqrt{2}`
+        for `'most_probable'` (the default), :math:`\sqrt{3}` for
+        `'rms'`, and :math:`\sqrt{8 / \pi}` for `'mean_magnitude'`.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The particle thermal speed in units of m / s.
+
+    Notes
+    -----
+    Unlike `thermal_speed`, this function performs no unit conversion,
+    particle parsing, or argument validation, so all inputs must already
+    be expressed in SI units.  It is intended for performance-sensitive
+    code where the overhead of `~astropy.units.Quantity` arithmetic
+    would dominate this otherwise simple formula.
+
+    Examples
+    --------
+    >>> thermal_speed_lite(1e6, 1.67e-27)
+    128587.396594...
+
+    """
+    return coef * np.sqrt(_K_B * T / mass)
+
+
+@lru_cache(maxsize=1024)
+def thermal_speed_cached(T, particle="p+", method="most_probable"):
+    r"""
+    A memoized variant of `thermal_speed_lite` that resolves the
+    particle by name and caches the result per argument tuple.
+
+    Parameters
+    ----------
+    T : float
+        The particle temperature in units of kelvin.
+
+    particle : str, optional
+        Representation of the particle species (e.g., `'p'` for protons,
+        `'D+'` for deuterium, or `'He-4 +1'` for singly ionized
+        helium-4), which defaults to protons.
+
+    method : str, optional
+        Method to be used for calculating the thermal speed. Options are
+        `'most_probable'` (default), `'rms'`, and `'mean_magnitude'`.
+
+    Returns
+    -------
+    float
+        The particle thermal speed in units of m / s.
+
+    Notes
+    -----
+    This is an opt-in convenience for code that queries the same
+    ``(T, particle, method)`` tuple repeatedly, as in Monte Carlo
+    post-processing or gridded parameter sweeps, where the call
+    amortizes to a dictionary lookup.  Inputs must be scalars in SI
+    units; array sweeps should call `thermal_speed_lite` directly.
+
+    Examples
+    --------
+    >>> thermal_speed_cached(1e6)
+    128486.573194...
+
+    """
+    try:
+        coef = _THERMAL_SPEED_COEFFICIENTS[method]
+    except KeyError:
+        raise ValueError(f"Method {method} not supported in thermal_speed_cached")
+    return thermal_speed_lite(T, _cached_particle_mass(particle), coef)
 
 
 @check_relativistic
@@ -485,24 +872,59 @@ def thermal_speed(T: u.K,
     <Quantity 6212510.3969422 m / s>
 
     """
-    m = mass if np.isfinite(mass) else atomic.particle_mass(particle)
+    m = mass.value if np.isfinite(mass) else _cached_particle_mass(particle.particle)
 
-    # different methods, as per https://en.wikipedia.org/wiki/Thermal_velocity
-    if method == "most_probable":
-        V = (np.sqrt(2 * k_B * T / m))
-    elif method == "rms":
-        V = (np.sqrt(3 * k_B * T / m))
-    elif method == "mean_magnitude":
-        V = (np.sqrt(8 * k_B * T / (m * np.pi)))
+    try:
+        coef = _THERMAL_SPEED_COEFFICIENTS[method]
+    except KeyError:
+        raise ValueError(f"Method {method} not supported in thermal_speed")
+
+    T_si = T.value
+    if isinstance(T_si, float):
+        V = coef * math.sqrt(_K_B * T_si / m)
     else:
-        raise ValueError("Method {method} not supported in thermal_speed")
+        V = thermal_speed_lite(T_si, m, coef)
 
-    return V
+    return V << u.m / u.s
+
+
+@_jit
+def thermal_pressure_lite(T, n):
+    r"""
+    The ``lite`` version of `thermal_pressure`: calculate the thermal
+    pressure from plain numbers instead of `~astropy.units.Quantity`
+    objects.
+
+    Parameters
+    ----------
+    T : float or ~numpy.ndarray
+        The particle temperature in units of kelvin.
+
+    n : float or ~numpy.ndarray
+        The particle number density in units of m**-3.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The thermal pressure in units of Pa.
+
+    Notes
+    -----
+    Unlike `thermal_pressure`, this function performs no unit conversion
+    or argument validation, so all inputs must already be expressed in
+    SI units.  It is intended for performance-sensitive code where the
+    overhead of `~astropy.units.Quantity` arithmetic would dominate this
+    otherwise simple formula.
+
+    Examples
+    --------
+    >>> thermal_pressure_lite(11604.5, 1e20)
+    16.021741...
+
+    """
+    return n * _K_B * T
 
 
-@validate_quantities(T={'can_be_negative': False,
-                        'equivalencies': u.temperature_energy()},
-                     n={'can_be_negative': False})
 def thermal_pressure(T: u.K, n: u.m ** -3) -> u.Pa:
     r"""
     Return the thermal pressure for a Maxwellian distribution.
@@ -544,8 +966,13 @@ def thermal_pressure(T: u.K, n: u.m ** -3) -> u.Pa:
     .. math::
         T_{th} = nk_{B}T
     """
+    T_si = _validate_si_value(T, 'T', 'thermal_pressure', u.K,
+                              equivalencies=u.temperature_energy(),
+                              can_be_negative=False)
+    n_si = _validate_si_value(n, 'n', 'thermal_pressure', u.m ** -3,
+                              can_be_negative=False)
 
-    return n * k_B * T
+    return thermal_pressure_lite(T_si, n_si) << u.Pa
 
 
 @check_relativistic
@@ -645,11 +1072,13 @@ def kappa_thermal_speed(T: u.K, kappa, particle="e-", method="most_probable") ->
         # thermal speed modulated by the following factor.
         # This is only true for "most probable" case. RMS and mean
         # magnitude velocities are same as Maxwellian.
-        coeff = np.sqrt((kappa - 3 / 2) / kappa)
+        coeff = math.sqrt((kappa - 3 / 2) / kappa)
     else:
         coeff = 1
 
-    return vTh * coeff
+    # scale the already-validated SI value directly; multiplying the
+    # Quantity would re-enter unit composition for a plain scale factor
+    return (vTh.value * coeff) << u.m / u.s
 
 
 @validate_quantities(n={'can_be_negative': False},
@@ -706,11 +1135,17 @@ def Hall_parameter(n: u.m ** -3,
     <Quantity 2.11158408e+17>
 
     """
-    from plasmapy.formulary.collisions import (fundamental_ion_collision_freq,
-                                               fundamental_electron_collision_freq)
+    global _collision_freqs
+    if _collision_freqs is None:
+        from plasmapy.formulary.collisions import (
+            fundamental_electron_collision_freq, fundamental_ion_collision_freq)
+        _collision_freqs = (fundamental_electron_collision_freq,
+                            fundamental_ion_collision_freq)
+    fundamental_electron_collision_freq, fundamental_ion_collision_freq = _collision_freqs
+
     gyro_frequency = gyrofrequency(B, particle)
     gyro_frequency = gyro_frequency / u.radian
-    if atomic.Particle(particle).particle == 'e-':
+    if _cached_particle_symbol(particle) == 'e-':
         coll_rate = fundamental_electron_collision_freq(T,
                                                         n,
                                                         ion_particle,
@@ -722,6 +1157,94 @@ def Hall_parameter(n: u.m ** -3,
     return gyro_frequency / coll_rate
 
 
+@_jit
+def gyrofrequency_lite(B, mass, Z):
+    r"""
+    The ``lite`` version of `gyrofrequency`: calculate the particle
+    gyrofrequency from plain numbers instead of
+    `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    B : float or ~numpy.ndarray
+        The magnetic field magnitude in units of tesla.
+
+    mass : float
+        The particle mass in units of kg.
+
+    Z : float
+        The particle charge state, signed (negative for electrons).
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The particle gyrofrequency in units of rad / s.
+
+    Notes
+    -----
+    Unlike `gyrofrequency`, this function performs no unit conversion,
+    particle parsing, or argument validation, so all inputs must already
+    be expressed in SI units.  It is intended for performance-sensitive
+    code where the overhead of `~astropy.units.Quantity` arithmetic
+    would dominate this otherwise simple formula.
+
+    Examples
+    --------
+    >>> gyrofrequency_lite(0.01, 1.67e-27, 1)
+    959387.205988...
+
+    """
+    return Z * _E * np.abs(B) / mass
+
+
+@lru_cache(maxsize=1024)
+def gyrofrequency_cached(B, particle="e-", signed=False):
+    r"""
+    A memoized variant of `gyrofrequency_lite` that resolves the
+    particle by name and caches the result per argument tuple.
+
+    Parameters
+    ----------
+    B : float
+        The magnetic field magnitude in units of tesla.
+
+    particle : str, optional
+        Representation of the particle species (e.g., `'p'` for protons,
+        `'D+'` for deuterium, or `'He-4 +1'` for singly ionized
+        helium-4), which defaults to electrons.
+
+    signed : bool, optional
+        The gyrofrequency can be defined as signed (negative for
+        electron, positive for ion). Default is `False` (unsigned, i.e.
+        always positive).
+
+    Returns
+    -------
+    float
+        The particle gyrofrequency in units of radians per second.
+
+    Notes
+    -----
+    This is an opt-in convenience for code that queries the same
+    ``(B, particle, signed)`` tuple repeatedly, as in Monte Carlo
+    post-processing or gridded parameter sweeps, where the call
+    amortizes to a dictionary lookup.  Inputs must be scalars in SI
+    units; array sweeps should call `gyrofrequency_lite` directly.
+
+    Examples
+    --------
+    >>> gyrofrequency_cached(0.01)
+    1758820008.37...
+    >>> gyrofrequency_cached(0.25, particle='p+')
+    23947082.8575...
+
+    """
+    mass, Z = _cached_mass_and_charge(particle)
+    if not signed:
+        Z = abs(Z)
+    return Z * _E / mass * abs(B)
+
+
 @validate_quantities(validations_on_return={'units': [u.rad / u.s, u.Hz],
                                             'equivalencies': [(u.cy / u.s, u.Hz)]})
 @angular_freq_to_hz
@@ -816,14 +1339,122 @@ def gyrofrequency(B: u.T, particle='e-', signed=False, Z=None) -> u.rad / u.s:
     2799249007.6528206 Hz
 
     """
-    m_i = atomic.particle_mass(particle)
-    Z = _grab_charge(particle, Z)
+    if Z is None:
+        m_i, Z = _cached_mass_and_charge(particle)
+    else:
+        m_i = _cached_particle_mass(particle)
+        Z = _charge_from_zmean(Z)
+    # Resolve the sign once here, at the Python level, and fold the
+    # charge, elementary charge, and mass into a single coefficient so
+    # the remaining work is one multiply over ``B``.
     if not signed:
         Z = abs(Z)
+    coef = Z * _E / m_i
+
+    B_si = B.value
+    if isinstance(B_si, float):
+        omega_ci = coef * abs(B_si)
+    else:
+        omega_ci = np.abs(B_si)
+        omega_ci *= coef
+
+    return omega_ci << u.rad / u.s
+
+
+@validate_quantities(validations_on_return={'units': [u.rad / u.s, u.Hz],
+                                            'equivalencies': [(u.cy / u.s, u.Hz)]})
+@angular_freq_to_hz
+def gyrofrequency_batch(B: u.T, particles, signed=False) -> u.rad / u.s:
+    r"""Calculate the gyrofrequencies of several particle species at once.
+
+    Parameters
+    ----------
+    B : ~astropy.units.Quantity
+        The magnetic field magnitude in units convertible to tesla,
+        either a scalar or an array broadcastable against `particles`.
+
+    particles : sequence of str or ~plasmapy.atomic.Particle
+        Representations of the particle species (e.g., `['e-', 'p']`).
 
-    omega_ci = u.rad * (Z * e * np.abs(B) / m_i).to(1 / u.s)
+    signed : bool, optional
+        The gyrofrequency can be defined as signed (negative for
+        electron, positive for ion). Default is `False` (unsigned, i.e.
+        always positive).
 
-    return omega_ci
+    Returns
+    -------
+    omega_c : ~astropy.units.Quantity
+        The gyrofrequencies in units of radians per second, one entry
+        per species.
+
+    Notes
+    -----
+    This is the batched counterpart of `gyrofrequency`.  The masses and
+    charges of all species are gathered into flat arrays once, so the
+    formula runs as a single broadcast over contiguous data instead of
+    one decorated call per species.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> gyrofrequency_batch(0.01*u.T, ['e-', 'p'])
+    <Quantity [1.758820e+09, 9.578833e+05] rad / s>
+
+    """
+    masses = np.array([_cached_particle_mass(p) for p in particles])
+    charges = np.array([float(_cached_integer_charge(p)) for p in particles])
+    if not signed:
+        np.abs(charges, out=charges)
+
+    omega_ci = gyrofrequency_lite(np.asarray(B.value, dtype=float),
+                                  masses, charges)
+
+    return omega_ci << u.rad / u.s
+
+
+@_jit
+def gyroradius_lite(B, Vperp, mass, Z):
+    r"""
+    The ``lite`` version of `gyroradius`: calculate the radius of
+    circular motion from plain numbers instead of
+    `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    B : float or ~numpy.ndarray
+        The magnetic field magnitude in units of tesla.
+
+    Vperp : float or ~numpy.ndarray
+        The component of particle velocity perpendicular to the
+        magnetic field, in units of m / s.
+
+    mass : float
+        The particle mass in units of kg.
+
+    Z : float
+        The particle charge state.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The unsigned particle gyroradius in units of meters.
+
+    Notes
+    -----
+    Unlike `gyroradius`, this function performs no unit conversion,
+    particle parsing, or argument validation, so all inputs must
+    already be expressed in SI units.  It is intended for
+    performance-sensitive code, e.g. evaluating gyroradii across a
+    simulation grid, where the abs, multiply, and divide fuse into a
+    single pass when numba is installed.
+
+    Examples
+    --------
+    >>> gyroradius_lite(0.2, 1e6, 1.672621923e-27, 1)
+    0.05219842...
+
+    """
+    return np.abs(Vperp) * mass / (np.abs(Z) * _E * np.abs(B))
 
 
 @validate_quantities(Vperp={'can_be_nan': True},
@@ -926,51 +1557,166 @@ def gyroradius(B: u.T,
 
     """
 
-    isfinite_Ti = np.isfinite(T_i)
-    isfinite_Vperp = np.isfinite(Vperp)
+    # work on the validated SI values; np.isfinite on the raw ndarray
+    # skips the Quantity __array_function__ dispatch
+    T_i_v = T_i.value
+    Vperp_v = Vperp.value
+    isfinite_Ti = np.isfinite(T_i_v)
+    isfinite_Vperp = np.isfinite(Vperp_v)
 
     # check 1: ensure either Vperp or T_i invalid, keeping in mind that
     # the underlying values of the astropy quantity may be numpy arrays
-    if np.any(np.logical_not(np.logical_xor(isfinite_Vperp, isfinite_Ti))):
+    if not np.all(isfinite_Vperp ^ isfinite_Ti):
         raise ValueError("Must give Vperp or T_i, but not both, as arguments to gyroradius")
 
+    # fast path for the common interactive call shape of all-scalar
+    # arguments with an explicit Vperp, which reduces to a single
+    # lite-kernel evaluation; finite temperatures fall through so the
+    # decorated thermal_speed call keeps its relativity guard
+    B_v = B.value
+    if isinstance(B_v, float) and isinstance(T_i_v, float) \
+            and isinstance(Vperp_v, float) and isfinite_Vperp:
+        m_i, Z = _cached_mass_and_charge(particle)
+        return gyroradius_lite(B_v, Vperp_v, m_i, Z) << u.m
+
     # check 2: get Vperp as the thermal speed if is not already a valid input
-    if np.isscalar(Vperp.value) and np.isscalar(T_i.value):  # both T_i and Vperp are scalars
-        # we know exactly one of them is nan from check 1
-        if isfinite_Ti:
-            # T_i is valid, so use it to determine Vperp
-            Vperp = thermal_speed(T_i, particle=particle)
-        # else: Vperp is alread valid, do nothing
-    elif np.isscalar(Vperp.value):  # only T_i is an array
-        # this means either Vperp must be nan, or T_i must be array of all nan,
-        # or else we couldn't have gotten through check 1
-        if isfinite_Vperp:
-            # Vperp is valid, T_i is a vector that is all nan
-            # uh...
-            Vperp = np.repeat(Vperp, len(T_i))
-        else:
-            # normal case where Vperp is scalar nan and T_i is valid array
-            Vperp = thermal_speed(T_i, particle=particle)
-    elif np.isscalar(T_i.value):  # only Vperp is an array
-        # this means either T_i must be nan, or V_perp must be array of all nan,
-        # or else we couldn't have gotten through check 1
-        if isfinite_Ti:
-            # T_i is valid, V_perp is an array of all nan
-            # uh...
-            Vperp = thermal_speed(np.repeat(T_i, len(Vperp)), particle=particle)
-        # else: normal case where T_i is scalar nan and Vperp is already a valid array
-        # so, do nothing
-    else:  # both T_i and Vperp are arrays
-        # we know all the elementwise combinations have one nan and one finite, due to check 1
-        # use the valid Vperps, and replace the others with those calculated from T_i
-        Vperp = Vperp.copy()  # avoid changing Vperp's value outside function
-        Vperp[isfinite_Ti] = thermal_speed(T_i[isfinite_Ti], particle=particle)
-
-    omega_ci = gyrofrequency(B, particle)
-
-    r_Li = np.abs(Vperp) / omega_ci
-
-    return r_Li
+    #
+    # Broadcasting T_i, Vperp, and the finiteness mask lets a single
+    # vectorized thermal_speed call and one np.where select the speed
+    # per element, replacing the old scalar/array branch ladder.  The
+    # nan entries of T_i are swapped for a placeholder of 1 K before
+    # the call, so no nan temperatures reach thermal_speed; the speeds
+    # computed from the placeholder are discarded by the np.where.
+    T_i_b, Vperp_b, finite_Ti_b = np.broadcast_arrays(
+        T_i_v, Vperp_v, isfinite_Ti)
+    vth = thermal_speed(np.where(finite_Ti_b, T_i_b, 1.0) << u.K,
+                        particle=particle).value
+    Vperp_si = np.where(finite_Ti_b, vth, Vperp_b)
+    if Vperp_si.ndim == 0:
+        Vperp_si = Vperp_si[()]
+
+    m_i, Z = _cached_mass_and_charge(particle)
+
+    r_Li = gyroradius_lite(B.value, Vperp_si, m_i, Z)
+
+    return r_Li << u.m
+
+
+@validate_quantities(Vperp={'can_be_nan': True},
+                     T_i={'can_be_nan': True,
+                          'equivalencies': u.temperature_energy()},
+                     validations_on_return={'equivalencies': u.dimensionless_angles()})
+def gyroradius_batch(B: u.T,
+                     particles,
+                     *,
+                     Vperp: u.m / u.s = np.nan * u.m / u.s,
+                     T_i: u.K = np.nan * u.K) -> u.m:
+    r"""Calculate the gyroradii of several particle species at once.
+
+    Parameters
+    ----------
+    B : ~astropy.units.Quantity
+        The magnetic field magnitude in units convertible to tesla,
+        either a scalar or an array broadcastable against `particles`.
+
+    particles : sequence of str or ~plasmapy.atomic.Particle
+        Representations of the particle species (e.g., `['e-', 'p']`).
+
+    Vperp : ~astropy.units.Quantity, optional
+        The component of particle velocity that is perpendicular to the
+        magnetic field in units convertible to meters per second.
+        Must be input as a keyword argument.
+
+    T_i : ~astropy.units.Quantity, optional
+        The particle temperature in units convertible to kelvin.
+        Must be input as a keyword argument.
+
+    Returns
+    -------
+    r_Li : ~astropy.units.Quantity
+        The gyroradii in units of meters, one entry per species.
+
+    Raises
+    ------
+    ValueError
+        If neither or both of `Vperp` and `T_i` are given.
+
+    Notes
+    -----
+    This is the batched counterpart of `gyroradius`.  Exactly one of
+    `Vperp` and `T_i` must be given; when `T_i` is given, the most
+    probable thermal speed of each species is used.  The masses and
+    charges of all species are gathered into flat arrays once, so the
+    formula runs as a single broadcast over contiguous data instead of
+    one decorated call per species.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> gyroradius_batch(0.2*u.T, ['e-', 'p+'], T_i=1e5*u.K)
+    <Quantity [4.949493e-05, 2.120875e-03] m>
+
+    """
+    isfinite_Ti = bool(np.all(np.isfinite(T_i.value)))
+    isfinite_Vperp = bool(np.all(np.isfinite(Vperp.value)))
+    if isfinite_Ti == isfinite_Vperp:
+        raise ValueError("Must give Vperp or T_i, but not both, as arguments "
+                         "to gyroradius_batch")
+
+    masses = np.array([_cached_particle_mass(p) for p in particles])
+    charges = np.abs(np.array([float(_cached_integer_charge(p))
+                               for p in particles]))
+
+    if isfinite_Ti:
+        Vperp_si = _SQRT2 * np.sqrt(_K_B * T_i.value / masses)
+    else:
+        Vperp_si = np.abs(Vperp.value)
+
+    omega_ci = gyrofrequency_lite(np.asarray(B.value, dtype=float),
+                                  masses, charges)
+
+    return (Vperp_si / omega_ci) << u.m
+
+
+@_jit
+def plasma_frequency_lite(n, mass, Z):
+    r"""
+    The ``lite`` version of `plasma_frequency`: calculate the particle
+    plasma frequency from plain numbers instead of
+    `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    n : float or ~numpy.ndarray
+        The particle number density in units of m\ :sup:`-3`\ .
+
+    mass : float
+        The particle mass in units of kg.
+
+    Z : float
+        The particle charge state.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The particle plasma frequency in units of radians per second.
+
+    Notes
+    -----
+    Unlike `plasma_frequency`, this function performs no unit
+    conversion, particle parsing, or argument validation, so all inputs
+    must already be expressed in SI units.  It is intended for
+    performance-sensitive code where the overhead of
+    `~astropy.units.Quantity` arithmetic would dominate this otherwise
+    simple formula.
+
+    Examples
+    --------
+    >>> plasma_frequency_lite(1e19, 1.672621923e-27, 1)
+    4163294533.45...
+
+    """
+    return Z * _E_OVER_SQRT_EPS0 * np.sqrt(n / mass)
 
 
 @validate_quantities(n={'can_be_negative': False},
@@ -1052,32 +1798,65 @@ def plasma_frequency(n: u.m**-3, particle='e-', z_mean=None) -> u.rad / u.s:
     """
 
     try:
-        m = atomic.particle_mass(particle)
         if z_mean is None:
             # warnings.warn("No z_mean given, defaulting to atomic charge",
             #               PhysicsWarning)
-            try:
-                Z = atomic.integer_charge(particle)
-            except Exception:
-                Z = 1
+            m, Z = _cached_mass_and_default_charge(particle)
         else:
+            m = _cached_particle_mass(particle)
             # using user provided average ionization
-            Z = z_mean
+            Z = _charge_from_zmean(z_mean)
         Z = np.abs(Z)
-        # TODO REPLACE WITH Z = np.abs(_grab_charge(particle, z_mean)), some bugs atm
     except Exception:
         raise ValueError(f"Invalid particle, {particle}, in "
                          "plasma_frequency.")
 
-    omega_p = u.rad * Z * e * np.sqrt(n / (eps0 * m))
+    n_si = n.value
+    if isinstance(n_si, float):
+        omega_p = Z * _E_OVER_SQRT_EPS0 * math.sqrt(n_si / m)
+    else:
+        omega_p = plasma_frequency_lite(n_si, m, Z)
 
-    return omega_p.si
+    return omega_p << u.rad / u.s
 
 
-@validate_quantities(T_e={'can_be_negative': False,
-                          'equivalencies': u.temperature_energy()},
-                     n_e={'can_be_negative': False})
-def Debye_length(T_e: u.K, n_e: u.m ** -3) -> u.m:
+@_jit
+def Debye_length_lite(T_e, n_e):
+    r"""
+    The ``lite`` version of `Debye_length`: calculate the Debye length
+    from plain numbers instead of `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    T_e : float or ~numpy.ndarray
+        Electron temperature in units of kelvin.
+
+    n_e : float or ~numpy.ndarray
+        Electron number density in units of m**-3.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The Debye length in units of m.
+
+    Notes
+    -----
+    Unlike `Debye_length`, this function performs no unit conversion or
+    argument validation, so all inputs must already be expressed in SI
+    units.  It is intended for performance-sensitive code where the
+    overhead of `~astropy.units.Quantity` arithmetic would dominate this
+    otherwise simple formula.
+
+    Examples
+    --------
+    >>> Debye_length_lite(5e6, 5e15)
+    0.002182255...
+
+    """
+    return np.sqrt(_EPS0 * _K_B * T_e / (n_e * _E ** 2))
+
+
+def Debye_length(T_e: u.K, n_e: u.m ** -3, out=None) -> u.m:
     r"""Calculate the characteristic decay length for electric fields,
      due to charge screening.
 
@@ -1089,6 +1868,12 @@ def Debye_length(T_e: u.K, n_e: u.m ** -3) -> u.m:
     n_e: ~astropy.units.Quantity
         Electron number density
 
+    out : ~numpy.ndarray, optional
+        A preallocated buffer to hold the result when the inputs are
+        arrays, with the broadcast shape of ``T_e`` and ``n_e``.
+        Useful in repeated grid sweeps to avoid reallocating the
+        output.
+
     Returns
     -------
     lambda_D : ~astropy.units.Quantity
@@ -1137,8 +1922,24 @@ def Debye_length(T_e: u.K, n_e: u.m ** -3) -> u.m:
     <Quantity 0.00218226 m>
 
     """
-    lambda_D = np.sqrt(eps0 * k_B * T_e / (n_e * e ** 2))
-    return lambda_D
+    T_e_si = _validate_si_value(T_e, 'T_e', 'Debye_length', u.K,
+                                equivalencies=u.temperature_energy(),
+                                can_be_negative=False)
+    n_e_si = _validate_si_value(n_e, 'n_e', 'Debye_length', u.m ** -3,
+                                can_be_negative=False)
+
+    if out is not None:
+        # sweep protocol: chain the ufuncs through the caller's buffer
+        # so repeated grid evaluations allocate nothing
+        np.multiply(T_e_si, _EPS0 * _K_B, out=out)
+        np.divide(out, n_e_si * _E ** 2, out=out)
+        np.sqrt(out, out=out)
+        lambda_D = out
+    elif isinstance(T_e_si, float) and isinstance(n_e_si, float):
+        lambda_D = math.sqrt(_EPS0 * _K_B * T_e_si / (n_e_si * _E ** 2))
+    else:
+        lambda_D = Debye_length_lite(T_e_si, n_e_si)
+    return lambda_D << u.m
 
 
 @validate_quantities(T_e={'can_be_negative': False,
@@ -1201,10 +2002,50 @@ def Debye_number(T_e: u.K, n_e: u.m ** -3) -> u.dimensionless_unscaled:
 
     """
 
-    lambda_D = Debye_length(T_e, n_e)
-    N_D = (4 / 3) * np.pi * n_e * lambda_D ** 3
+    lambda_D = Debye_length(T_e, n_e).value
+    N_D = _FOUR_THIRDS_PI * n_e.value * lambda_D ** 3
+
+    return N_D << u.dimensionless_unscaled
+
+
+@_jit
+def inertial_length_lite(n, mass, Z):
+    r"""
+    The ``lite`` version of `inertial_length`: calculate a charged
+    particle's inertial length from plain numbers instead of
+    `~astropy.units.Quantity` objects.
+
+    Parameters
+    ----------
+    n : float or ~numpy.ndarray
+        The particle number density in units of m\ :sup:`-3`\ .
+
+    mass : float
+        The particle mass in units of kg.
+
+    Z : float
+        The particle charge state.
+
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The particle inertial length in units of meters.
+
+    Notes
+    -----
+    Unlike `inertial_length`, this function performs no unit
+    conversion, particle parsing, or argument validation, so all
+    inputs must already be expressed in SI units.  It is intended for
+    performance-sensitive code such as evaluating the inertial length
+    across a simulation grid.
+
+    Examples
+    --------
+    >>> inertial_length_lite(5e19, 1.672621923e-27, 1)
+    0.03220316...
 
-    return N_D
+    """
+    return _C / (np.abs(Z) * _E_OVER_SQRT_EPS0 * np.sqrt(n / mass))
 
 
 @validate_quantities(n={'can_be_negative': False},
@@ -1266,13 +2107,51 @@ def inertial_length(n: u.m ** -3, particle: atomic.Particle) -> u.m:
     <Quantity 2376534.75601976 m>
 
     """
-    omega_p = plasma_frequency(n, particle=particle)
+    # particle_input guarantees a charged Particle here, so the mass
+    # and charge resolve from the cache and the whole computation is a
+    # single fused pass in the lite kernel; calling plasma_frequency
+    # would validate n a second time.
+    m_i, Z = _cached_mass_and_charge(particle.particle)
+    d_i = inertial_length_lite(n.value, m_i, Z)
+
+    return d_i << u.m
+
+
+@_jit
+def magnetic_pressure_lite(B):
+    r"""
+    The ``lite`` version of `magnetic_pressure`: calculate the magnetic
+    pressure from plain numbers instead of `~astropy.units.Quantity`
+    objects.
+
+    Parameters
+    ----------
+    B : float or ~numpy.ndarray
+        The magnetic field magnitude in units of tesla.
 
-    return c / omega_p
+    Returns
+    -------
+    float or ~numpy.ndarray
+        The magnetic pressure in units of pascals.
+
+    Notes
+    -----
+    Unlike `magnetic_pressure`, this function performs no unit
+    conversion or argument validation, so the input must already be
+    expressed in SI units.  The square and the division fuse into a
+    single pass over array input when numba is installed.
+
+    Examples
+    --------
+    >>> magnetic_pressure_lite(0.1)
+    3978.873577...
+
+    """
+    return B * B / (2.0 * _MU0)
 
 
 @validate_quantities
-def magnetic_pressure(B: u.T) -> u.Pa:
+def magnetic_pressure(B: u.T, out=None) -> u.Pa:
     r"""
     Calculate the magnetic pressure.
 
@@ -1281,6 +2160,11 @@ def magnetic_pressure(B: u.T) -> u.Pa:
     B : ~astropy.units.Quantity
         The magnetic field in units convertible to tesla.
 
+    out : ~numpy.ndarray, optional
+        A preallocated buffer to hold the result when `B` is an array,
+        with the same shape and dtype as ``B.value``.  Useful in
+        repeated large-array sweeps to avoid reallocating the output.
+
     Returns
     -------
     p_B : ~astropy.units.Quantity
@@ -1327,7 +2211,19 @@ def magnetic_pressure(B: u.T) -> u.Pa:
     <Quantity 3978.8735773 Pa>
 
     """
-    return (B ** 2) / (2 * mu0)
+    B_si = B.value
+    if isinstance(B_si, float):
+        return (B_si ** 2 / (2 * _MU0)) << u.Pa
+
+    # chain the square and the division through one buffer (the
+    # caller's, if provided) instead of allocating a temporary array
+    # per operation; the division is kept as a division so this path
+    # rounds identically to the scalar one
+    if out is None:
+        out = np.empty_like(B_si)
+    np.multiply(B_si, B_si, out=out)
+    np.divide(out, 2 * _MU0, out=out)
+    return out << u.Pa
 
 
 @validate_quantities
@@ -1386,7 +2282,13 @@ def magnetic_energy_density(B: u.T) -> u.J / u.m ** 3:
     <Quantity 3978.8735773 J / m3>
 
     """
-    return magnetic_pressure(B)
+    B_si = B.value
+    if isinstance(B_si, float):
+        return (B_si ** 2 / (2 * _MU0)) << u.J / u.m ** 3
+
+    buf = np.multiply(B_si, B_si)
+    np.divide(buf, 2 * _MU0, out=buf)
+    return buf << u.J / u.m ** 3
 
 
 @validate_quantities(n_e={'can_be_negative': False},
@@ -1446,11 +2348,16 @@ def upper_hybrid_frequency(B: u.T, n_e: u.m ** -3) -> u.rad / u.s:
     <Quantity 6.37350961e+10 Hz>
 
     """
-    omega_pe = plasma_frequency(n=n_e)
-    omega_ce = gyrofrequency(B)
-    omega_uh = (np.sqrt(omega_pe ** 2 + omega_ce ** 2))
+    # Compute both component frequencies on the validated SI values;
+    # going through the decorated functions would pay for unit
+    # validation twice more on the same inputs.  np.hypot fuses the
+    # squares and the sqrt into one C loop and cannot overflow in the
+    # intermediate squares.
+    omega_pe = _E_OVER_SQRT_EPS0 * np.sqrt(n_e.value / _M_E)
+    omega_ce = _E / _M_E * np.abs(B.value)
+    omega_uh = np.hypot(omega_pe, omega_ce)
 
-    return omega_uh
+    return omega_uh << u.rad / u.s
 
 
 @validate_quantities(n_i={'can_be_negative': False},
@@ -1524,15 +2431,58 @@ def lower_hybrid_frequency(B: u.T, n_i: u.m ** -3, ion='p+') -> u.rad / u.s:
     # We do not need a charge state here, so the sole intent is to
     # catch invalid ions.
     try:
-        atomic.integer_charge(ion)
+        Z = _cached_integer_charge(ion)
     except Exception:
         raise ValueError("Invalid ion in lower_hybrid_frequency.")
 
-    omega_ci = gyrofrequency(B, particle=ion)
-    omega_pi = plasma_frequency(n_i, particle=ion)
-    omega_ce = gyrofrequency(B)
-    omega_lh = ((omega_ci * omega_ce) ** -1 + omega_pi ** -2) ** -0.5
-    # TODO possibly optimize the above line via np.sqrt
-    omega_lh = omega_lh
-
-    return omega_lh
+    # Compute the three component frequencies on the validated SI
+    # values; going through the decorated functions here would pay for
+    # unit validation three more times on the same inputs.
+    m_i = _cached_particle_mass(ion)
+    B_si = np.abs(B.value)
+    omega_ci = abs(Z) * _E / m_i * B_si
+    omega_ce = _E / _M_E * B_si
+    omega_pi = abs(Z) * _E_OVER_SQRT_EPS0 * np.sqrt(n_i.value / m_i)
+
+    inv_sq = 1.0 / (omega_ci * omega_ce) + 1.0 / (omega_pi * omega_pi)
+    if isinstance(inv_sq, float):
+        omega_lh = 1.0 / math.sqrt(inv_sq)
+    else:
+        # finish in place: one buffer instead of a temporary per op
+        np.sqrt(inv_sq, out=inv_sq)
+        np.reciprocal(inv_sq, out=inv_sq)
+        omega_lh = inv_sq
+
+    return omega_lh << u.rad / u.s
+
+
+# Pre-resolve the particle strings that dominate interactive use, so
+# even the first call for one of them skips the atomic string parser.
+for _p in ('e-', 'p+', 'p', 'D+', 'T+', 'He+', 'alpha', 'n'):
+    _cached_mass_and_charge(_p)
+    _cached_particle_mass(_p)
+    _cached_integer_charge(_p)
+del _p
+
+
+if njit is not None:
+    # Compile the scalar specializations of the lite kernels eagerly so
+    # that the numba compile lag lands here, at import, instead of on a
+    # user's first call.  With ``cache=True`` the compiled kernels are
+    # served from numba's on-disk cache on every import after the first,
+    # so this is a one-off cost per environment.  Array specializations
+    # are still compiled lazily on first use.
+    for _kernel, _args in (
+        (Alfven_speed_lite, (1.0, 1.0)),
+        (ion_sound_speed_lite, (1.0, 1.0, 1.0, 1.0)),
+        (thermal_speed_lite, (1.0, 1.0)),
+        (thermal_pressure_lite, (1.0, 1.0)),
+        (gyrofrequency_lite, (1.0, 1.0, 1.0)),
+        (gyroradius_lite, (1.0, 1.0, 1.0, 1.0)),
+        (plasma_frequency_lite, (1.0, 1.0, 1.0)),
+        (Debye_length_lite, (1.0, 1.0)),
+        (inertial_length_lite, (1.0, 1.0, 1.0)),
+        (magnetic_pressure_lite, (1.0,)),
+    ):
+        _kernel(*_args)
+    del _kernel, _args
@@ -13,18 +13,32 @@ from astropy.constants import c, m_p, m_e, e, mu0
 
 from plasmapy.formulary.parameters import (mass_density,
                                            Alfven_speed,
+                                           Alfven_speed_lite,
                                            gyrofrequency,
+                                           gyrofrequency_batch,
+                                           gyrofrequency_cached,
+                                           gyrofrequency_lite,
                                            gyroradius,
+                                           gyroradius_batch,
+                                           gyroradius_lite,
                                            thermal_speed,
+                                           thermal_speed_cached,
+                                           thermal_speed_lite,
                                            thermal_pressure,
+                                           thermal_pressure_lite,
                                            kappa_thermal_speed,
                                            plasma_frequency,
+                                           plasma_frequency_lite,
                                            Debye_length,
+                                           Debye_length_lite,
                                            Debye_number,
                                            inertial_length,
+                                           inertial_length_lite,
                                            ion_sound_speed,
+                                           ion_sound_speed_lite,
                                            magnetic_energy_density,
                                            magnetic_pressure,
+                                           magnetic_pressure_lite,
                                            upper_hybrid_frequency,
                                            lower_hybrid_frequency)
 
@@ -552,6 +566,22 @@ def test_gyrofrequency():
     assert_can_handle_nparray(gyrofrequency, kwargs={"signed": False})
 
 
+def test_gyrofrequency_batch():
+    r"""Test the gyrofrequency_batch function in parameters.py."""
+
+    particles = ['e-', 'p', 'He-4 1+']
+    omega_c = gyrofrequency_batch(0.01 * u.T, particles)
+    for ii, particle in enumerate(particles):
+        assert np.isclose(omega_c[ii].value,
+                          gyrofrequency(0.01 * u.T, particle).value)
+
+    omega_c_signed = gyrofrequency_batch(0.01 * u.T, particles, signed=True)
+    assert omega_c_signed[0] < 0
+    assert np.all(omega_c_signed[1:] > 0)
+
+    assert gyrofrequency_batch(B, particles, to_hz=True).unit.is_equivalent(u.Hz)
+
+
 def test_gyroradius():
     r"""Test the gyroradius function in parameters.py."""
 
@@ -693,6 +723,29 @@ class Test_gyroradius:
         assert_quantity_allclose(Vperp1, Vperp2)
 
 
+def test_gyroradius_batch():
+    r"""Test the gyroradius_batch function in parameters.py."""
+
+    particles = ['e-', 'p+']
+    r_Li = gyroradius_batch(0.2 * u.T, particles, T_i=1e5 * u.K)
+    for ii, particle in enumerate(particles):
+        assert np.isclose(r_Li[ii].value,
+                          gyroradius(0.2 * u.T, particle, T_i=1e5 * u.K).value)
+
+    r_Li = gyroradius_batch(0.2 * u.T, particles, Vperp=1e5 * u.m / u.s)
+    for ii, particle in enumerate(particles):
+        assert np.isclose(
+            r_Li[ii].value,
+            gyroradius(0.2 * u.T, particle, Vperp=1e5 * u.m / u.s).value)
+
+    with pytest.raises(ValueError):
+        gyroradius_batch(0.2 * u.T, particles)
+
+    with pytest.raises(ValueError):
+        gyroradius_batch(0.2 * u.T, particles,
+                         T_i=1e5 * u.K, Vperp=1e5 * u.m / u.s)
+
+
 def test_plasma_frequency():
     r"""Test the plasma_frequency function in parameters.py."""
 
@@ -748,6 +801,23 @@ def test_plasma_frequency():
     assert_can_handle_nparray(plasma_frequency)
 
 
+def test_gyroradius_relativistic_temperature():
+    r"""Test that scalar and array temperatures get the same
+    relativity diagnostics from gyroradius."""
+
+    with pytest.raises(RelativityError):
+        gyroradius(0.2 * u.T, T_i=5e9 * u.K)
+
+    with pytest.raises(RelativityError):
+        gyroradius(0.2 * u.T, T_i=np.array([5e9, 5e9]) * u.K)
+
+    with pytest.warns(RelativityWarning):
+        gyroradius(0.2 * u.T, T_i=5e8 * u.K)
+
+    with pytest.warns(RelativityWarning):
+        gyroradius(0.2 * u.T, T_i=np.array([5e8, 5e8]) * u.K)
+
+
 def test_Debye_length():
     r"""Test the Debye_length function in parameters.py."""
 
@@ -782,6 +852,17 @@ def test_Debye_length():
     assert_can_handle_nparray(Debye_length)
 
 
+def test_Debye_length_out():
+    r"""Test that Debye_length writes into a preallocated buffer."""
+
+    T_arr = np.array([1e6, 2e6]) * u.K
+    n_arr = np.array([1e19, 2e19]) * u.m ** -3
+    buf = np.empty(2)
+    result = Debye_length(T_arr, n_arr, out=buf)
+    assert np.shares_memory(result.value, buf)
+    assert np.allclose(result.value, Debye_length(T_arr, n_arr).value)
+
+
 def test_Debye_number():
     r"""Test the Debye_number function in parameters.py."""
 
@@ -1004,3 +1085,86 @@ def test_lower_hybrid_frequency():
         assert lower_hybrid_frequency(1.3, 1e19) == lower_hybrid_frequency(1.3 * u.T,
                                                                            1e19 * u.m ** -3)
     assert_can_handle_nparray(lower_hybrid_frequency)
+
+
+def test_Alfven_speed_lite():
+    r"""Test that Alfven_speed_lite matches Alfven_speed."""
+    assert np.isclose(Alfven_speed_lite(1.0, rho.si.value),
+                      Alfven_speed(1.0 * u.T, rho).value)
+
+
+def test_ion_sound_speed_lite():
+    r"""Test that ion_sound_speed_lite matches ion_sound_speed."""
+    assert np.isclose(ion_sound_speed_lite(1e6, 1e6, m_p.value, 1),
+                      ion_sound_speed(T_e=1e6 * u.K, T_i=1e6 * u.K,
+                                      ion='p').value)
+
+
+def test_thermal_speed_lite():
+    r"""Test that thermal_speed_lite matches thermal_speed."""
+    assert np.isclose(thermal_speed_lite(1e6, m_p.value),
+                      thermal_speed(1e6 * u.K, 'p').value)
+
+
+def test_thermal_speed_cached():
+    r"""Test that thermal_speed_cached matches thermal_speed."""
+    assert np.isclose(thermal_speed_cached(1e6, 'p'),
+                      thermal_speed(1e6 * u.K, 'p').value)
+
+    assert np.isclose(thermal_speed_cached(1e6, 'p', method='rms'),
+                      thermal_speed(1e6 * u.K, 'p', method='rms').value)
+
+    with pytest.raises(ValueError):
+        thermal_speed_cached(1e6, 'p', method='sadks')
+
+
+def test_thermal_pressure_lite():
+    r"""Test that thermal_pressure_lite matches thermal_pressure."""
+    assert np.isclose(thermal_pressure_lite(1e6, 5e19),
+                      thermal_pressure(1e6 * u.K, 5e19 * u.m ** -3).value)
+
+
+def test_gyrofrequency_lite():
+    r"""Test that gyrofrequency_lite matches gyrofrequency."""
+    assert np.isclose(gyrofrequency_lite(0.2, m_p.value, 1),
+                      gyrofrequency(0.2 * u.T, particle='p').value)
+
+
+def test_gyrofrequency_cached():
+    r"""Test that gyrofrequency_cached matches gyrofrequency."""
+    assert np.isclose(gyrofrequency_cached(0.2, 'p'),
+                      gyrofrequency(0.2 * u.T, particle='p').value)
+
+    assert np.isclose(gyrofrequency_cached(0.01, 'e-', signed=True),
+                      gyrofrequency(0.01 * u.T, signed=True).value)
+
+
+def test_gyroradius_lite():
+    r"""Test that gyroradius_lite matches gyroradius."""
+    assert np.isclose(gyroradius_lite(0.2, 1e5, m_p.value, 1),
+                      gyroradius(0.2 * u.T, particle='p',
+                                 Vperp=1e5 * u.m / u.s).value)
+
+
+def test_plasma_frequency_lite():
+    r"""Test that plasma_frequency_lite matches plasma_frequency."""
+    assert np.isclose(plasma_frequency_lite(5e19, m_p.value, 1),
+                      plasma_frequency(5e19 * u.m ** -3, particle='p').value)
+
+
+def test_Debye_length_lite():
+    r"""Test that Debye_length_lite matches Debye_length."""
+    assert np.isclose(Debye_length_lite(1e6, 5e19),
+                      Debye_length(1e6 * u.K, 5e19 * u.m ** -3).value)
+
+
+def test_inertial_length_lite():
+    r"""Test that inertial_length_lite matches inertial_length."""
+    assert np.isclose(inertial_length_lite(5e19, m_p.value, 1),
+                      inertial_length(5e19 * u.m ** -3, 'p').value)
+
+
+def test_magnetic_pressure_lite():
+    r"""Test that magnetic_pressure_lite matches magnetic_pressure."""
+    assert np.isclose(magnetic_pressure_lite(0.2),
+                      magnetic_pressure(0.2 * u.T).value)
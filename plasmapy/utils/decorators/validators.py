@@ -175,6 +175,12 @@ class ValidateQuantities(CheckUnits, CheckValues):
         self.f = f
         wrapped_sign = inspect.signature(f)
 
+        # `_get_validations` depends only on the function's signature
+        # (annotations, defaults, and the decorator's validation
+        # dictionaries), never on the argument values, so its result is
+        # built on the first call and reused on every call after that.
+        cached_validations = []
+
         @preserve_signature
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
@@ -183,7 +189,9 @@ class ValidateQuantities(CheckUnits, CheckValues):
             bound_args.apply_defaults()
 
             # get conditioned validations
-            validations = self._get_validations(bound_args)
+            if not cached_validations:
+                cached_validations.append(self._get_validations(bound_args))
+            validations = cached_validations[0]
 
             # validate (input) argument units and values
             for arg_name in validations:
@@ -351,13 +359,17 @@ class ValidateQuantities(CheckUnits, CheckValues):
                 and unit is not None \
                 and not arg_validations['pass_equivalent_units']:
 
-            if not arg.unit.is_equivalent(unit, equivalencies=None):
-                # non-standard conversion
-                warnings.warn(ImplicitUnitConversionWarning(
-                    f"{err_msg} has a non-standard unit conversion..."
-                    f"converting {arg.unit} to {unit}"))
-
-            arg = arg.to(unit, equivalencies=equiv)
+            # when the argument already carries the exact target unit
+            # object there is nothing to convert, so skip the unit
+            # solver entirely
+            if arg.unit is not unit:
+                if not arg.unit.is_equivalent(unit, equivalencies=None):
+                    # non-standard conversion
+                    warnings.warn(ImplicitUnitConversionWarning(
+                        f"{err_msg} has a non-standard unit conversion..."
+                        f"converting {arg.unit} to {unit}"))
+
+                arg = arg.to(unit, equivalencies=equiv)
         elif err is not None:
             raise err
 